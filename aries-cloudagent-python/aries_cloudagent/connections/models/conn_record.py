@@ -162,6 +162,8 @@ class ConnRecord(BaseRecord):
     ACCEPT_MANUAL = "manual"
     ACCEPT_AUTO = "auto"
 
+    READY_CACHE_TTL = 30
+
     def __init__(
         self,
         *,
@@ -397,6 +399,34 @@ class ConnRecord(BaseRecord):
         """Accessor for multi use invitation mode."""
         return self.invitation_mode == self.INVITATION_MODE_MULTI
 
+    @staticmethod
+    def _ready_cache_key(connection_id: str) -> str:
+        """Cache key for the readiness of a connection."""
+        return f"connection_ready::{connection_id}"
+
+    @classmethod
+    async def retrieve_is_ready(
+        cls, session: ProfileSession, connection_id: str
+    ) -> bool:
+        """
+        Check whether a connection is ready, caching a ready result for a while.
+
+        Args:
+            session: The active profile session
+            connection_id: The ID of the connection to check
+
+        Raises:
+            StorageNotFoundError: If the connection record is not found
+
+        """
+        cache_key = cls._ready_cache_key(connection_id)
+        if await cls.get_cached_key(session, cache_key):
+            return True
+        record = await cls.retrieve_by_id(session, connection_id)
+        if record.is_ready:
+            await cls.set_cached_key(session, cache_key, True, cls.READY_CACHE_TTL)
+        return record.is_ready
+
     async def post_save(self, session: ProfileSession, *args, **kwargs):
         """Perform post-save actions.
 
@@ -405,9 +435,18 @@ class ConnRecord(BaseRecord):
         """
         await super().post_save(session, *args, **kwargs)
 
-        # clear cache key set by connection manager
-        cache_key = f"connection_target::{self.connection_id}"
-        await self.clear_cached_key(session, cache_key)
+        # clear cache keys set by connection manager and by retrieve_is_ready
+        await self.clear_cached_key(session, f"connection_target::{self.connection_id}")
+        await self.clear_cached_key(session, self._ready_cache_key(self.connection_id))
+
+    async def delete_record(self, session: ProfileSession):
+        """Remove the stored record, dropping its cached readiness.
+
+        Args:
+            session: The active profile session
+        """
+        await super().delete_record(session)
+        await self.clear_cached_key(session, self._ready_cache_key(self.connection_id))
 
     async def metadata_get(
         self, session: ProfileSession, key: str, default: Any = None
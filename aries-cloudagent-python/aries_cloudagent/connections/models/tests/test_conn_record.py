@@ -1,5 +1,7 @@
-from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
+from ....cache.base import BaseCache
+from ....cache.in_memory import InMemoryCache
 from ....core.in_memory import InMemoryProfile
 from ....protocols.connections.v1_0.messages.connection_invitation import (
     ConnectionInvitation,
@@ -333,6 +335,31 @@ class TestConnRecord(AsyncTestCase):
         await record.save(self.session)
         assert await record.metadata_get(self.session, "key") is None
 
+    async def test_retrieve_is_ready(self):
+        self.session.context.injector.bind_instance(BaseCache, InMemoryCache())
+        record = self.test_conn_record
+        await record.save(self.session)
+        conn_id = record.connection_id
+
+        assert await ConnRecord.retrieve_is_ready(self.session, conn_id)
+        with async_mock.patch.object(
+            ConnRecord, "retrieve_by_id", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            assert await ConnRecord.retrieve_is_ready(self.session, conn_id)
+            mock_retrieve.assert_not_called()
+
+        record.state = ConnRecord.State.ABANDONED.rfc160
+        await record.save(self.session)  # clears cached readiness
+        assert not await ConnRecord.retrieve_is_ready(self.session, conn_id)
+        assert not await ConnRecord.retrieve_is_ready(self.session, conn_id)
+
+        record.state = ConnRecord.State.COMPLETED.rfc160
+        await record.save(self.session)
+        assert await ConnRecord.retrieve_is_ready(self.session, conn_id)
+        await record.delete_record(self.session)
+        with self.assertRaises(StorageNotFoundError):
+            await ConnRecord.retrieve_is_ready(self.session, conn_id)
+
     async def test_metadata_get_default(self):
         record = ConnRecord(
             my_did=self.test_did,
@@ -12,6 +12,8 @@ from ...utils.classloader import ClassLoader
 
 LOGGER = logging.getLogger(__name__)
 
+_DUMP_SCHEMAS = {}
+
 
 def resolve_class(the_cls, relative_cls: type = None):
     """
@@ -150,7 +152,7 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema = self.Schema(unknown=unknown or EXCLUDE)
+        schema = self._get_dump_schema(unknown or EXCLUDE)
         try:
             return (
                 schema.dumps(self, separators=(",", ":"))
@@ -163,6 +165,29 @@ class BaseModel(ABC):
                 f"{self.__class__.__name__} schema validation failed"
             ) from err
 
+    def _get_dump_schema(self, unknown: str = None) -> "BaseModelSchema":
+        """
+        Get a shared schema instance for serialization.
+
+        Schema construction deep-copies the declared fields, which dominates the
+        cost of dumping a model; dump hooks keep no state across calls, so one
+        instance per schema class serves every serialization. Loading does keep
+        state (message decorators), so deserialization builds its own schema.
+
+        Args:
+            unknown: Behaviour for unknown attributes
+
+        Returns:
+            The schema instance
+
+        """
+        schema_class = self.Schema
+        schema = _DUMP_SCHEMAS.get((schema_class, unknown))
+        if schema is None:
+            schema = schema_class(unknown=unknown)
+            _DUMP_SCHEMAS[(schema_class, unknown)] = schema
+        return schema
+
     def validate(self, unknown: str = None):
         """Validate a constructed model."""
         schema = self.Schema(unknown=unknown)
@@ -269,6 +294,26 @@ class BaseModelSchema(Schema):
         """
         return self._get_model_class()
 
+    def get_attribute(self, obj, attr, default):
+        """
+        Get the value of an attribute to serialize.
+
+        Models hold their values as plain attributes: read them directly rather
+        than through marshmallow's generic key-path and item lookup.
+
+        Args:
+            obj: The object being serialized
+            attr: The attribute name
+            default: The value to return if the attribute is absent
+
+        Returns:
+            The attribute value
+
+        """
+        if isinstance(obj, BaseModel):
+            return getattr(obj, attr, default)
+        return super().get_attribute(obj, attr, default)
+
     @pre_load
     def skip_dump_only(self, data, **kwargs):
         """
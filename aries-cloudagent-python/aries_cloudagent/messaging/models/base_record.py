@@ -6,7 +6,7 @@ import sys
 import uuid
 
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence, Union
 
 from marshmallow import fields
 
@@ -323,6 +323,55 @@ class BaseRecord(BaseModel):
                 result.append(cls.from_storage(record.id, vals))
         return result
 
+    @classmethod
+    async def query_iter(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        page_size: int = None,
+    ) -> AsyncIterator["BaseRecord"]:
+        """
+        Iterate over stored records, fetching them from storage a page at a time.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            page_size: Number of records to fetch per page (default per backend)
+        """
+
+        storage = session.inject(BaseStorage)
+        search = storage.search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            page_size,
+            options={"retrieveTags": False},
+        )
+        try:
+            async for record in search:
+                vals = json.loads(record.value)
+                if match_post_filter(
+                    vals,
+                    post_filter_positive,
+                    positive=True,
+                    alt=alt,
+                ) and match_post_filter(
+                    vals,
+                    post_filter_negative,
+                    positive=False,
+                    alt=alt,
+                ):
+                    yield cls.from_storage(record.id, vals)
+        finally:
+            await search.close()
+
     async def save(
         self,
         session: ProfileSession,
@@ -59,6 +59,21 @@ class TestBase(AsyncTestCase):
             with self.assertRaises(BaseModelError):
                 model.serialize()
 
+    def test_ser_reuses_schema(self):
+        model = ModelImpl(attr="hello world")
+        assert model.serialize() == {"attr": "hello world"}
+        assert model.serialize(as_string=True) == '{"attr":"hello world"}'
+        assert model._get_dump_schema(EXCLUDE) is model._get_dump_schema(EXCLUDE)
+        assert ModelImpl(attr="other")._get_dump_schema(
+            EXCLUDE
+        ) is model._get_dump_schema(EXCLUDE)
+
+    def test_schema_get_attribute(self):
+        schema = SchemaImpl()
+        assert schema.get_attribute(ModelImpl(attr="a"), "attr", None) == "a"
+        assert schema.get_attribute(ModelImpl(), "missing", "dflt") == "dflt"
+        assert schema.get_attribute({"attr": "b"}, "attr", None) == "b"
+
     def test_from_json_x(self):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
@@ -239,6 +239,35 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    async def test_query_iter(self):
+        session = InMemoryProfile.test_session()
+        for (a, code) in (("one", "red"), ("two", "red"), ("three", "blue")):
+            await ARecordImpl(a=a, b="b", code=code).save(session)
+
+        result = [
+            rec.a
+            async for rec in ARecordImpl.query_iter(
+                session, {"code": "red"}, page_size=1
+            )
+        ]
+        assert sorted(result) == ["one", "two"]
+
+        result = [
+            rec.a
+            async for rec in ARecordImpl.query_iter(
+                session, post_filter_negative={"a": "two"}, page_size=1
+            )
+        ]
+        assert sorted(result) == ["one", "three"]
+
+        result = [
+            rec.a
+            async for rec in ARecordImpl.query_iter(
+                session, post_filter_positive={"a": ["two", "three"]}, alt=True
+            )
+        ]
+        assert sorted(result) == ["three", "two"]
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
@@ -131,7 +131,7 @@ class CredentialManager:
         cred_def_id: str = None,
         issuer_did: str = None,
         trace: bool = False,
-    ) -> V10CredentialExchange:
+    ) -> Tuple[V10CredentialExchange, CredentialProposal]:
         """
         Create a credential proposal.
 
@@ -151,7 +151,7 @@ class CredentialManager:
             issuer_did: Issuer DID for credential proposal
 
         Returns:
-            Resulting credential exchange record including credential proposal
+            A tuple (credential exchange record, credential proposal message)
 
         """
         credential_proposal_message = CredentialProposal(
@@ -183,7 +183,7 @@ class CredentialManager:
         )
         async with self._profile.session() as session:
             await cred_ex_record.save(session, reason="create credential proposal")
-        return cred_ex_record
+        return (cred_ex_record, credential_proposal_message)
 
     async def receive_proposal(
         self, message: CredentialProposal, connection_id: str
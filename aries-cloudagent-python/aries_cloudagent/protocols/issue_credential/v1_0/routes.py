@@ -1,6 +1,9 @@
 """Credential exchange admin routes."""
 
-from aiohttp import web
+import functools
+import orjson
+
+from aiohttp import hdrs, web
 from aiohttp_apispec import (
     docs,
     match_info_schema,
@@ -9,7 +12,7 @@ from aiohttp_apispec import (
     response_schema,
 )
 from json.decoder import JSONDecodeError
-from marshmallow import fields, validate
+from marshmallow import fields, validate, ValidationError
 
 from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord
@@ -41,6 +44,7 @@ from .manager import CredentialManager, CredentialManagerError
 from .message_types import SPEC_URI
 from .messages.credential_proposal import CredentialProposal, CredentialProposalSchema
 from .messages.inner.credential_preview import (
+    CredAttrSpec,
     CredentialPreview,
     CredentialPreviewSchema,
 )
@@ -50,6 +54,117 @@ from .models.credential_exchange import (
 )
 
 
+_ROLES = tuple(
+    v for k, v in vars(V10CredentialExchange).items() if k.startswith("ROLE_")
+)
+_STATES = tuple(
+    v for k, v in vars(V10CredentialExchange).items() if k.startswith("STATE_")
+)
+_CRED_DEF_TAGS = tuple(CRED_DEF_TAGS)
+_PREVIEW_CACHE_MAX_SPEC_BYTES = 4096
+_EMPTY_JSON = b"{}"
+_JSON_HEADERS = {hdrs.CONTENT_TYPE: "application/json"}
+_SWAGGER_TAG = {
+    "name": "issue-credential v1.0",
+    "description": "Credential issue v1.0",
+    "externalDocs": {"description": "Specification", "url": SPEC_URI},
+}
+
+# errors that fail an exchange step, mapped to 400 by the handlers
+_ISSUER_ERRORS = (
+    BaseModelError,
+    CredentialManagerError,
+    IndyIssuerError,
+    LedgerError,
+    StorageError,
+)
+_SEND_REQUEST_ERRORS = (
+    BaseModelError,
+    CredentialManagerError,
+    IndyHolderError,
+    LedgerError,
+    StorageError,
+)
+_STORE_ERRORS = (BaseModelError, CredentialManagerError, IndyHolderError, StorageError)
+
+
+def _orjson_response(data, status: int = 200) -> web.Response:
+    """Build a JSON response, encoding the payload with orjson."""
+
+    return web.Response(
+        body=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        headers=_JSON_HEADERS,
+    )
+
+
+async def _read_json(request: web.BaseRequest):
+    """Parse the request body as JSON, straight from its bytes with orjson."""
+
+    raw = await request.read()
+    if not raw:
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as err:
+        raise web.HTTPBadRequest(reason=f"Invalid JSON body: {err}") from err
+
+
+def _cred_def_tag_kwargs(body: dict, _tags=_CRED_DEF_TAGS) -> dict:
+    """Pick the non-empty cred def tags out of a request body."""
+
+    return {t: v for t, v in zip(_tags, map(body.get, _tags)) if v}
+
+
+@functools.lru_cache(maxsize=256)
+def _validated_preview_attrs(preview_json: bytes) -> tuple:
+    """Validate a credential preview, memoized on its canonical JSON.
+
+    Returns (name, value, mime_type) tuples, so cached entries stay immutable.
+    """
+
+    preview = CredentialPreview.deserialize(orjson.loads(preview_json))
+    return tuple((a.name, a.value, a.mime_type) for a in preview.attributes)
+
+
+def _load_preview(preview_spec) -> CredentialPreview:
+    """Deserialize a credential preview into a fresh instance for each request.
+
+    Validation is memoized for small specs only, bounding the cache by size.
+    """
+
+    preview_json = orjson.dumps(preview_spec, option=orjson.OPT_SORT_KEYS)
+    if len(preview_json) > _PREVIEW_CACHE_MAX_SPEC_BYTES:
+        return CredentialPreview.deserialize(preview_spec)
+    return CredentialPreview(
+        attributes=[
+            CredAttrSpec(name=name, value=value, mime_type=mime_type)
+            for (name, value, mime_type) in _validated_preview_attrs(preview_json)
+        ]
+    )
+
+
+class OneOfSet(validate.OneOf):
+    """OneOf validator testing membership against a frozenset of the choices."""
+
+    def __init__(self, choices, **kwargs):
+        """Initialize validator, keeping choices in a set for constant-time lookup."""
+
+        super().__init__(choices, **kwargs)
+        self._choice_set = frozenset(self.choices)
+
+    def __call__(self, value) -> str:
+        """Validate that value is one of the choices."""
+
+        try:
+            if value not in self._choice_set:
+                raise ValidationError(self._format_error(value))
+        except TypeError as error:
+            raise ValidationError(self._format_error(value)) from error
+
+        return value
+
+
 class IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for Issue Credential Module."""
 
@@ -70,24 +185,12 @@ class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
     role = fields.Str(
         description="Role assigned in credential exchange",
         required=False,
-        validate=validate.OneOf(
-            [
-                getattr(V10CredentialExchange, m)
-                for m in vars(V10CredentialExchange)
-                if m.startswith("ROLE_")
-            ]
-        ),
+        validate=OneOfSet(_ROLES),
     )
     state = fields.Str(
         description="Credential exchange state",
         required=False,
-        validate=validate.OneOf(
-            [
-                getattr(V10CredentialExchange, m)
-                for m in vars(V10CredentialExchange)
-                if m.startswith("STATE_")
-            ]
-        ),
+        validate=OneOfSet(_STATES),
     )
 
 
@@ -281,6 +384,13 @@ class CredExIdMatchInfoSchema(OpenAPISchema):
     )
 
 
+# schemas shared across several routes: build each once
+_CRED_EX_SCHEMA = V10CredentialExchangeSchema()
+_CRED_EX_ID_MATCH_INFO_SCHEMA = CredExIdMatchInfoSchema()
+_FREE_OFFER_REQUEST_SCHEMA = V10CredentialFreeOfferRequestSchema()
+_MODULE_RESPONSE_SCHEMA = IssueCredentialModuleResponseSchema()
+
+
 @docs(
     tags=["issue-credential v1.0"],
     summary="Fetch all credential exchange records",
@@ -308,26 +418,29 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    # page records in from storage, but release the session before responding
     try:
         async with context.session() as session:
-            records = await V10CredentialExchange.query(
-                session=session,
-                tag_filter=tag_filter,
-                post_filter_positive=post_filter,
-            )
-        results = [record.serialize() for record in records]
+            results = [
+                record.serialize()
+                async for record in V10CredentialExchange.query_iter(
+                    session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                )
+            ]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return _orjson_response({"results": results})
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Fetch a single credential exchange record",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_retrieve(request: web.BaseRequest):
     """
     Request handler for fetching single credential exchange record.
@@ -355,7 +468,7 @@ async def credential_exchange_retrieve(request: web.BaseRequest):
     except (BaseModelError, StorageError) as err:
         await internal_error(err, web.HTTPBadRequest, cred_ex_record, outbound_handler)
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
@@ -363,7 +476,7 @@ async def credential_exchange_retrieve(request: web.BaseRequest):
     summary="Send holder a credential, automating entire flow",
 )
 @request_schema(V10CredentialCreateSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_create(request: web.BaseRequest):
     """
     Request handler for creating a credential from attr values.
@@ -382,31 +495,33 @@ async def credential_exchange_create(request: web.BaseRequest):
     r_time = get_timer()
 
     context: AdminRequestContext = request["context"]
+    settings = context.settings
 
-    body = await request.json()
+    body = await _read_json(request)
+    get = body.get
 
-    comment = body.get("comment")
-    preview_spec = body.get("credential_proposal")
+    comment = get("comment")
+    preview_spec = get("credential_proposal")
     if not preview_spec:
         raise web.HTTPBadRequest(reason="credential_proposal must be provided")
-    auto_remove = body.get("auto_remove")
-    trace_msg = body.get("trace")
+    auto_remove = get("auto_remove")
+    trace_msg = get("trace")
 
     try:
-        preview = CredentialPreview.deserialize(preview_spec)
+        preview = _load_preview(preview_spec)
 
         credential_proposal = CredentialProposal(
             comment=comment,
             credential_proposal=preview,
-            **{t: body.get(t) for t in CRED_DEF_TAGS if body.get(t)},
+            **_cred_def_tag_kwargs(body),
         )
         credential_proposal.assign_trace_decorator(
-            context.settings,
+            settings,
             trace_msg,
         )
 
         trace_event(
-            context.settings,
+            settings,
             credential_proposal,
             outcome="credential_exchange_create.START",
         )
@@ -426,13 +541,13 @@ async def credential_exchange_create(request: web.BaseRequest):
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     trace_event(
-        context.settings,
+        settings,
         credential_offer_message,
         outcome="credential_exchange_create.END",
         perf_counter=r_time,
     )
 
-    return web.json_response(credential_exchange_record.serialize())
+    return _orjson_response(credential_exchange_record.serialize())
 
 
 @docs(
@@ -440,7 +555,7 @@ async def credential_exchange_create(request: web.BaseRequest):
     summary="Send holder a credential, automating entire flow",
 )
 @request_schema(V10CredentialProposalRequestMandSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_send(request: web.BaseRequest):
     """
     Request handler for sending credential from issuer to holder from attr values.
@@ -459,22 +574,24 @@ async def credential_exchange_send(request: web.BaseRequest):
     r_time = get_timer()
 
     context: AdminRequestContext = request["context"]
+    settings = context.settings
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json()
+    body = await _read_json(request)
+    get = body.get
 
-    comment = body.get("comment")
-    connection_id = body.get("connection_id")
-    preview_spec = body.get("credential_proposal")
+    comment = get("comment")
+    connection_id = get("connection_id")
+    preview_spec = get("credential_proposal")
     if not preview_spec:
         raise web.HTTPBadRequest(reason="credential_proposal must be provided")
-    auto_remove = body.get("auto_remove")
-    trace_msg = body.get("trace")
+    auto_remove = get("auto_remove")
+    trace_msg = get("trace")
 
     connection_record = None
     cred_ex_record = None
     try:
-        preview = CredentialPreview.deserialize(preview_spec)
+        preview = _load_preview(preview_spec)
         async with context.session() as session:
             connection_record = await ConnRecord.retrieve_by_id(session, connection_id)
             if not connection_record.is_ready:
@@ -483,15 +600,15 @@ async def credential_exchange_send(request: web.BaseRequest):
         credential_proposal = CredentialProposal(
             comment=comment,
             credential_proposal=preview,
-            **{t: body.get(t) for t in CRED_DEF_TAGS if body.get(t)},
+            **_cred_def_tag_kwargs(body),
         )
         credential_proposal.assign_trace_decorator(
-            context.settings,
+            settings,
             trace_msg,
         )
 
         trace_event(
-            context.settings,
+            settings,
             credential_proposal,
             outcome="credential_exchange_send.START",
         )
@@ -521,13 +638,13 @@ async def credential_exchange_send(request: web.BaseRequest):
     )
 
     trace_event(
-        context.settings,
+        settings,
         credential_offer_message,
         outcome="credential_exchange_send.END",
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
@@ -535,7 +652,7 @@ async def credential_exchange_send(request: web.BaseRequest):
     summary="Send issuer a credential proposal",
 )
 @request_schema(V10CredentialProposalRequestOptSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_send_proposal(request: web.BaseRequest):
     """
     Request handler for sending credential proposal.
@@ -550,37 +667,38 @@ async def credential_exchange_send_proposal(request: web.BaseRequest):
     r_time = get_timer()
 
     context: AdminRequestContext = request["context"]
+    settings = context.settings
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json()
+    body = await _read_json(request)
+    get = body.get
 
-    connection_id = body.get("connection_id")
-    comment = body.get("comment")
-    preview_spec = body.get("credential_proposal")
-    auto_remove = body.get("auto_remove")
-    trace_msg = body.get("trace")
+    connection_id = get("connection_id")
+    comment = get("comment")
+    preview_spec = get("credential_proposal")
+    auto_remove = get("auto_remove")
+    trace_msg = get("trace")
 
     connection_record = None
     cred_ex_record = None
     try:
-        preview = CredentialPreview.deserialize(preview_spec) if preview_spec else None
+        preview = _load_preview(preview_spec) if preview_spec else None
         async with context.session() as session:
             connection_record = await ConnRecord.retrieve_by_id(session, connection_id)
             if not connection_record.is_ready:
                 raise web.HTTPForbidden(reason=f"Connection {connection_id} not ready")
 
         credential_manager = CredentialManager(context.profile)
-        cred_ex_record = await credential_manager.create_proposal(
+        (
+            cred_ex_record,
+            credential_proposal,
+        ) = await credential_manager.create_proposal(
             connection_id,
             comment=comment,
             credential_preview=preview,
             auto_remove=auto_remove,
             trace=trace_msg,
-            **{t: body.get(t) for t in CRED_DEF_TAGS if body.get(t)},
-        )
-
-        credential_proposal = CredentialProposal.deserialize(
-            cred_ex_record.credential_proposal_dict
+            **_cred_def_tag_kwargs(body),
         )
         result = cred_ex_record.serialize()
 
@@ -598,13 +716,13 @@ async def credential_exchange_send_proposal(request: web.BaseRequest):
     )
 
     trace_event(
-        context.settings,
+        settings,
         credential_proposal,
         outcome="credential_exchange_send_proposal.END",
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 async def _create_free_offer(
@@ -619,7 +737,7 @@ async def _create_free_offer(
 ):
     """Create a credential offer and related exchange record."""
 
-    credential_preview = CredentialPreview.deserialize(preview_spec)
+    credential_preview = _load_preview(preview_spec)
     credential_proposal = CredentialProposal(
         comment=comment,
         credential_proposal=credential_preview,
@@ -629,14 +747,13 @@ async def _create_free_offer(
         profile.settings,
         trace_msg,
     )
-    credential_proposal_dict = credential_proposal.serialize()
 
+    # the offer stores the proposal on the record: no need to serialize it here
     cred_ex_record = V10CredentialExchange(
         connection_id=connection_id,
         initiator=V10CredentialExchange.INITIATOR_SELF,
         role=V10CredentialExchange.ROLE_ISSUER,
         credential_definition_id=cred_def_id,
-        credential_proposal_dict=credential_proposal_dict,
         auto_issue=auto_issue,
         auto_remove=auto_remove,
         trace=trace_msg,
@@ -646,7 +763,7 @@ async def _create_free_offer(
 
     (cred_ex_record, credential_offer_message) = await credential_manager.create_offer(
         cred_ex_record,
-        counter_proposal=None,
+        counter_proposal=credential_proposal,
         comment=comment,
     )
 
@@ -657,7 +774,7 @@ async def _create_free_offer(
     tags=["issue-credential v1.0"],
     summary="Create a credential offer, independent of any proposal",
 )
-@request_schema(V10CredentialFreeOfferRequestSchema())
+@request_schema(_FREE_OFFER_REQUEST_SCHEMA)
 @response_schema(V10CreateFreeOfferResultSchema(), 200, description="")
 async def credential_exchange_create_free_offer(request: web.BaseRequest):
     """
@@ -676,25 +793,27 @@ async def credential_exchange_create_free_offer(request: web.BaseRequest):
     r_time = get_timer()
 
     context: AdminRequestContext = request["context"]
+    settings = context.settings
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json()
+    body = await _read_json(request)
+    get = body.get
 
-    cred_def_id = body.get("cred_def_id")
+    cred_def_id = get("cred_def_id")
     if not cred_def_id:
         raise web.HTTPBadRequest(reason="cred_def_id is required")
 
-    auto_issue = body.get(
-        "auto_issue", context.settings.get("debug.auto_respond_credential_request")
+    auto_issue = get(
+        "auto_issue", settings.get("debug.auto_respond_credential_request")
     )
-    auto_remove = body.get("auto_remove")
-    comment = body.get("comment")
-    preview_spec = body.get("credential_preview")
+    auto_remove = get("auto_remove")
+    comment = get("comment")
+    preview_spec = get("credential_preview")
     if not preview_spec:
         raise web.HTTPBadRequest(reason=("Missing credential_preview"))
 
-    connection_id = body.get("connection_id")
-    trace_msg = body.get("trace")
+    connection_id = get("connection_id")
+    trace_msg = get("trace")
 
     async with context.session() as session:
         wallet = session.inject(BaseWallet)
@@ -706,18 +825,15 @@ async def credential_exchange_create_free_offer(request: web.BaseRequest):
                 conn_did = await wallet.get_local_did(connection_record.my_did)
             except (WalletError, StorageError) as err:
                 raise web.HTTPBadRequest(reason=err.roll_up) from err
+            did_info = await wallet.get_public_did()
         else:
-            conn_did = await wallet.get_public_did()
-            if not conn_did:
+            did_info = await wallet.get_public_did()
+            if not did_info:
                 raise web.HTTPBadRequest(reason="Wallet has no public DID")
+            conn_did = did_info
             connection_id = None
 
-        did_info = await wallet.get_public_did()
-        del wallet
-
-    endpoint = did_info.metadata.get(
-        "endpoint", context.settings.get("default_endpoint")
-    )
+    endpoint = did_info.metadata.get("endpoint", settings.get("default_endpoint"))
     if not endpoint:
         raise web.HTTPBadRequest(reason="An endpoint for the public DID is required")
 
@@ -735,7 +851,7 @@ async def credential_exchange_create_free_offer(request: web.BaseRequest):
         )
 
         trace_event(
-            context.settings,
+            settings,
             credential_offer_message,
             outcome="credential_exchange_create_free_offer.END",
             perf_counter=r_time,
@@ -744,13 +860,7 @@ async def credential_exchange_create_free_offer(request: web.BaseRequest):
         oob_url = serialize_outofband(credential_offer_message, conn_did, endpoint)
         result = cred_ex_record.serialize()
 
-    except (
-        BaseModelError,
-        CredentialManagerError,
-        IndyIssuerError,
-        LedgerError,
-        StorageError,
-    ) as err:
+    except _ISSUER_ERRORS as err:
         await internal_error(
             err,
             web.HTTPBadRequest,
@@ -759,15 +869,15 @@ async def credential_exchange_create_free_offer(request: web.BaseRequest):
         )
 
     response = {"record": result, "oob_url": oob_url}
-    return web.json_response(response)
+    return _orjson_response(response)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Send holder a credential offer, independent of any proposal",
 )
-@request_schema(V10CredentialFreeOfferRequestSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@request_schema(_FREE_OFFER_REQUEST_SCHEMA)
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_send_free_offer(request: web.BaseRequest):
     """
     Request handler for sending free credential offer.
@@ -785,25 +895,27 @@ async def credential_exchange_send_free_offer(request: web.BaseRequest):
     r_time = get_timer()
 
     context: AdminRequestContext = request["context"]
+    settings = context.settings
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json()
+    body = await _read_json(request)
+    get = body.get
 
-    connection_id = body.get("connection_id")
-    cred_def_id = body.get("cred_def_id")
+    connection_id = get("connection_id")
+    cred_def_id = get("cred_def_id")
     if not cred_def_id:
         raise web.HTTPBadRequest(reason="cred_def_id is required")
 
-    auto_issue = body.get(
-        "auto_issue", context.settings.get("debug.auto_respond_credential_request")
+    auto_issue = get(
+        "auto_issue", settings.get("debug.auto_respond_credential_request")
     )
 
-    auto_remove = body.get("auto_remove")
-    comment = body.get("comment")
-    preview_spec = body.get("credential_preview")
+    auto_remove = get("auto_remove")
+    comment = get("comment")
+    preview_spec = get("credential_preview")
     if not preview_spec:
         raise web.HTTPBadRequest(reason=("Missing credential_preview"))
-    trace_msg = body.get("trace")
+    trace_msg = get("trace")
 
     cred_ex_record = None
     connection_record = None
@@ -841,22 +953,22 @@ async def credential_exchange_send_free_offer(request: web.BaseRequest):
     await outbound_handler(credential_offer_message, connection_id=connection_id)
 
     trace_event(
-        context.settings,
+        settings,
         credential_offer_message,
         outcome="credential_exchange_send_free_offer.END",
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Send holder a credential offer in reference to a proposal with preview",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
 @request_schema(V10CredentialBoundOfferRequestSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_send_bound_offer(request: web.BaseRequest):
     """
     Request handler for sending bound credential offer.
@@ -876,12 +988,17 @@ async def credential_exchange_send_bound_offer(request: web.BaseRequest):
     context: AdminRequestContext = request["context"]
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json() if request.body_exists else {}
+    body = await _read_json(request) if request.body_exists else {}
     proposal_spec = body.get("counter_proposal")
+    try:
+        counter_proposal = (
+            CredentialProposal.deserialize(proposal_spec) if proposal_spec else None
+        )
+    except BaseModelError as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     credential_exchange_id = request.match_info["cred_ex_id"]
     cred_ex_record = None
-    connection_record = None
     try:
         async with context.session() as session:
             try:
@@ -891,13 +1008,13 @@ async def credential_exchange_send_bound_offer(request: web.BaseRequest):
             except StorageNotFoundError as err:
                 raise web.HTTPNotFound(reason=err.roll_up) from err
 
-            if cred_ex_record.state != (
-                V10CredentialExchange.STATE_PROPOSAL_RECEIVED
-            ):  # check state here: manager call creates free offers too
+            state = cred_ex_record.state
+            expected_state = V10CredentialExchange.STATE_PROPOSAL_RECEIVED
+            if state != expected_state:
+                # check state here: manager call creates free offers too
                 raise CredentialManagerError(
-                    f"Credential exchange {cred_ex_record.credential_exchange_id} "
-                    f"in {cred_ex_record.state} state "
-                    f"(must be {V10CredentialExchange.STATE_PROPOSAL_RECEIVED})"
+                    f"Credential exchange {credential_exchange_id} "
+                    f"in {state} state (must be {expected_state})"
                 )
 
             connection_id = cred_ex_record.connection_id
@@ -911,23 +1028,16 @@ async def credential_exchange_send_bound_offer(request: web.BaseRequest):
             credential_offer_message,
         ) = await credential_manager.create_offer(
             cred_ex_record,
-            counter_proposal=(
-                CredentialProposal.deserialize(proposal_spec) if proposal_spec else None
-            ),
+            counter_proposal=counter_proposal,
             comment=None,
         )
 
         result = cred_ex_record.serialize()
 
-    except (
-        BaseModelError,
-        CredentialManagerError,
-        IndyIssuerError,
-        LedgerError,
-        StorageError,
-    ) as err:
-        async with context.session() as session:
-            await cred_ex_record.save_error_state(session, reason=err.message)
+    except _ISSUER_ERRORS as err:
+        if cred_ex_record:  # nothing to mark if retrieval failed
+            async with context.session() as session:
+                await cred_ex_record.save_error_state(session, reason=err.message)
         await internal_error(
             err,
             web.HTTPBadRequest,
@@ -944,15 +1054,15 @@ async def credential_exchange_send_bound_offer(request: web.BaseRequest):
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Send issuer a credential request",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_send_request(request: web.BaseRequest):
     """
     Request handler for sending credential request.
@@ -972,7 +1082,6 @@ async def credential_exchange_send_request(request: web.BaseRequest):
     credential_exchange_id = request.match_info["cred_ex_id"]
 
     cred_ex_record = None
-    connection_record = None
     try:
         async with context.session() as session:
             try:
@@ -1000,15 +1109,10 @@ async def credential_exchange_send_request(request: web.BaseRequest):
 
         result = cred_ex_record.serialize()
 
-    except (
-        BaseModelError,
-        CredentialManagerError,
-        IndyHolderError,
-        LedgerError,
-        StorageError,
-    ) as err:
-        async with context.session() as session:
-            await cred_ex_record.save_error_state(session, reason=err.message)
+    except _SEND_REQUEST_ERRORS as err:
+        if cred_ex_record:  # nothing to mark if retrieval failed
+            async with context.session() as session:
+                await cred_ex_record.save_error_state(session, reason=err.message)
         await internal_error(
             err,
             web.HTTPBadRequest,
@@ -1025,16 +1129,16 @@ async def credential_exchange_send_request(request: web.BaseRequest):
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Send holder a credential",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
 @request_schema(V10CredentialIssueRequestSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_issue(request: web.BaseRequest):
     """
     Request handler for sending credential.
@@ -1051,13 +1155,12 @@ async def credential_exchange_issue(request: web.BaseRequest):
     context: AdminRequestContext = request["context"]
     outbound_handler = request["outbound_message_router"]
 
-    body = await request.json()
+    body = await _read_json(request)
     comment = body.get("comment")
 
     credential_exchange_id = request.match_info["cred_ex_id"]
 
     cred_ex_record = None
-    connection_record = None
     try:
         async with context.session() as session:
             try:
@@ -1067,9 +1170,7 @@ async def credential_exchange_issue(request: web.BaseRequest):
             except StorageNotFoundError as err:
                 raise web.HTTPNotFound(reason=err.roll_up) from err
             connection_id = cred_ex_record.connection_id
-
-            connection_record = await ConnRecord.retrieve_by_id(session, connection_id)
-            if not connection_record.is_ready:
+            if not await ConnRecord.retrieve_is_ready(session, connection_id):
                 raise web.HTTPForbidden(reason=f"Connection {connection_id} not ready")
 
         credential_manager = CredentialManager(context.profile)
@@ -1080,15 +1181,10 @@ async def credential_exchange_issue(request: web.BaseRequest):
 
         result = cred_ex_record.serialize()
 
-    except (
-        BaseModelError,
-        CredentialManagerError,
-        IndyIssuerError,
-        LedgerError,
-        StorageError,
-    ) as err:
-        async with context.session() as session:
-            await cred_ex_record.save_error_state(session, reason=err.message)
+    except _ISSUER_ERRORS as err:
+        if cred_ex_record:  # nothing to mark if retrieval failed
+            async with context.session() as session:
+                await cred_ex_record.save_error_state(session, reason=err.message)
         await internal_error(
             err,
             web.HTTPBadRequest,
@@ -1105,16 +1201,16 @@ async def credential_exchange_issue(request: web.BaseRequest):
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Store a received credential",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
 @request_schema(V10CredentialStoreRequestSchema())
-@response_schema(V10CredentialExchangeSchema(), 200, description="")
+@response_schema(_CRED_EX_SCHEMA, 200, description="")
 async def credential_exchange_store(request: web.BaseRequest):
     """
     Request handler for storing credential.
@@ -1131,16 +1227,17 @@ async def credential_exchange_store(request: web.BaseRequest):
     context: AdminRequestContext = request["context"]
     outbound_handler = request["outbound_message_router"]
 
-    try:
-        body = await request.json() or {}
-        credential_id = body.get("credential_id")
-    except JSONDecodeError:
-        credential_id = None
+    credential_id = None
+    if request.body_exists:
+        try:
+            body = orjson.loads(await request.read()) or {}
+            credential_id = body.get("credential_id")
+        except JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+            pass
 
     credential_exchange_id = request.match_info["cred_ex_id"]
 
     cred_ex_record = None
-    connection_record = None
     try:
         async with context.session() as session:
             try:
@@ -1151,8 +1248,7 @@ async def credential_exchange_store(request: web.BaseRequest):
                 raise web.HTTPNotFound(reason=err.roll_up) from err
 
             connection_id = cred_ex_record.connection_id
-            connection_record = await ConnRecord.retrieve_by_id(session, connection_id)
-            if not connection_record.is_ready:
+            if not await ConnRecord.retrieve_is_ready(session, connection_id):
                 raise web.HTTPForbidden(reason=f"Connection {connection_id} not ready")
 
         credential_manager = CredentialManager(context.profile)
@@ -1167,12 +1263,7 @@ async def credential_exchange_store(request: web.BaseRequest):
         ) = await credential_manager.send_credential_ack(cred_ex_record)
         result = cred_ex_record.serialize()  # pick up state done
 
-    except (
-        BaseModelError,
-        CredentialManagerError,
-        IndyHolderError,
-        StorageError,
-    ) as err:
+    except _STORE_ERRORS as err:
         # protocol finished OK: do not set cred ex record state null
         await internal_error(
             err,
@@ -1188,16 +1279,16 @@ async def credential_exchange_store(request: web.BaseRequest):
         perf_counter=r_time,
     )
 
-    return web.json_response(result)
+    return _orjson_response(result)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Send a problem report for credential exchange",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
 @request_schema(V10CredentialProblemReportRequestSchema())
-@response_schema(IssueCredentialModuleResponseSchema(), 200, description="")
+@response_schema(_MODULE_RESPONSE_SCHEMA, 200, description="")
 async def credential_exchange_problem_report(request: web.BaseRequest):
     """
     Request handler for sending problem report.
@@ -1210,7 +1301,7 @@ async def credential_exchange_problem_report(request: web.BaseRequest):
     outbound_handler = request["outbound_message_router"]
 
     credential_exchange_id = request.match_info["cred_ex_id"]
-    body = await request.json()
+    body = await _read_json(request)
 
     credential_manager = CredentialManager(context.profile)
 
@@ -1230,15 +1321,15 @@ async def credential_exchange_problem_report(request: web.BaseRequest):
 
     await outbound_handler(report, connection_id=cred_ex_record.connection_id)
 
-    return web.json_response({})
+    return web.Response(body=_EMPTY_JSON, headers=_JSON_HEADERS)
 
 
 @docs(
     tags=["issue-credential v1.0"],
     summary="Remove an existing credential exchange record",
 )
-@match_info_schema(CredExIdMatchInfoSchema())
-@response_schema(IssueCredentialModuleResponseSchema(), 200, description="")
+@match_info_schema(_CRED_EX_ID_MATCH_INFO_SCHEMA)
+@response_schema(_MODULE_RESPONSE_SCHEMA, 200, description="")
 async def credential_exchange_remove(request: web.BaseRequest):
     """
     Request handler for removing a credential exchange record.
@@ -1263,7 +1354,7 @@ async def credential_exchange_remove(request: web.BaseRequest):
     except StorageError as err:
         await internal_error(err, web.HTTPBadRequest, cred_ex_record, outbound_handler)
 
-    return web.json_response({})
+    return web.Response(body=_EMPTY_JSON, headers=_JSON_HEADERS)
 
 
 async def register(app: web.Application):
@@ -1319,12 +1410,4 @@ def post_process_routes(app: web.Application):
     """Amend swagger API."""
 
     # Add top-level tags description
-    if "tags" not in app._state["swagger_dict"]:
-        app._state["swagger_dict"]["tags"] = []
-    app._state["swagger_dict"]["tags"].append(
-        {
-            "name": "issue-credential v1.0",
-            "description": "Credential issue v1.0",
-            "externalDocs": {"description": "Specification", "url": SPEC_URI},
-        }
-    )
+    app._state["swagger_dict"].setdefault("tags", []).append(_SWAGGER_TAG)
@@ -209,7 +209,7 @@ class TestCredentialManager(AsyncTestCase):
         with async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
-            exchange: V10CredentialExchange = await self.manager.create_proposal(
+            (exchange, proposal) = await self.manager.create_proposal(
                 connection_id,
                 auto_offer=True,
                 comment=comment,
@@ -226,8 +226,7 @@ class TestCredentialManager(AsyncTestCase):
                 cred_def_id=None,
             )  # OK to leave underspecified until offer
 
-        proposal = CredentialProposal.deserialize(exchange.credential_proposal_dict)
-
+        assert exchange.credential_proposal_dict == proposal.serialize()
         assert exchange.auto_offer
         assert exchange.connection_id == connection_id
         assert not exchange.credential_definition_id  # leave underspecified until offer
@@ -247,7 +246,7 @@ class TestCredentialManager(AsyncTestCase):
         with async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
-            exchange: V10CredentialExchange = await self.manager.create_proposal(
+            (exchange, proposal) = await self.manager.create_proposal(
                 connection_id,
                 auto_offer=True,
                 comment=comment,
@@ -256,8 +255,7 @@ class TestCredentialManager(AsyncTestCase):
             )
             save_ex.assert_called_once()
 
-        proposal = CredentialProposal.deserialize(exchange.credential_proposal_dict)
-
+        assert exchange.credential_proposal_dict == proposal.serialize()
         assert exchange.auto_offer
         assert exchange.connection_id == connection_id
         assert not exchange.credential_definition_id  # leave underspecified until offer
@@ -1,3 +1,5 @@
+import orjson
+
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
 from .....admin.request_context import AdminRequestContext
@@ -34,19 +36,47 @@ class TestCredentialRoutes(AsyncTestCase):
 
         with async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
-        ) as mock_cred_ex:
-            mock_cred_ex.query = async_mock.CoroutineMock()
-            mock_cred_ex.query.return_value = [mock_cred_ex]
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "_orjson_response"
+        ) as mock_response:
+
+            async def _query_iter(*args, **kwargs):
+                for record in (mock_cred_ex, mock_cred_ex):
+                    yield record
+
+            mock_cred_ex.query_iter = async_mock.MagicMock(side_effect=_query_iter)
             mock_cred_ex.serialize = async_mock.MagicMock()
             mock_cred_ex.serialize.return_value = {"hello": "world"}
 
-            with async_mock.patch.object(
-                test_module.web, "json_response"
-            ) as mock_response:
-                await test_module.credential_exchange_list(self.request)
-                mock_response.assert_called_once_with(
-                    {"results": [mock_cred_ex.serialize.return_value]}
-                )
+            await test_module.credential_exchange_list(self.request)
+            mock_response.assert_called_once_with(
+                {"results": [{"hello": "world"}, {"hello": "world"}]}
+            )
+            mock_cred_ex.query_iter.assert_called_once_with(
+                async_mock.ANY,
+                tag_filter={"thread_id": "dummy"},
+                post_filter_positive={
+                    "connection_id": "dummy",
+                    "role": "dummy",
+                    "state": "dummy",
+                },
+            )
+
+    async def test_credential_exchange_list_empty(self):
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "_orjson_response"
+        ) as mock_response:
+
+            async def _query_iter(*args, **kwargs):
+                for record in ():
+                    yield record
+
+            mock_cred_ex.query_iter = async_mock.MagicMock(side_effect=_query_iter)
+
+            await test_module.credential_exchange_list(self.request)
+            mock_response.assert_called_once_with({"results": []})
 
     async def test_credential_exchange_list_x(self):
         self.request.query = {
@@ -59,14 +89,72 @@ class TestCredentialRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex:
-            mock_cred_ex.connection_id = "conn-123"
-            mock_cred_ex.thread_id = "conn-123"
-            mock_cred_ex.query = async_mock.CoroutineMock(
-                side_effect=test_module.StorageError()
-            )
+
+            async def _query_iter(*args, **kwargs):
+                raise test_module.StorageError()
+                yield
+
+            mock_cred_ex.query_iter = async_mock.MagicMock(side_effect=_query_iter)
+
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.credential_exchange_list(self.request)
 
+    async def test_credential_exchange_list_x_later_page(self):
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "_orjson_response"
+        ) as mock_response:
+
+            async def _query_iter(*args, **kwargs):
+                yield mock_cred_ex
+                raise test_module.StorageError()
+
+            mock_cred_ex.query_iter = async_mock.MagicMock(side_effect=_query_iter)
+            mock_cred_ex.serialize = async_mock.MagicMock(return_value={})
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_list(self.request)
+            mock_response.assert_not_called()
+
+    async def test_credential_exchange_list_matches_retrieve(self):
+        cred_def_id = "LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1"
+        cred_ex = test_module.V10CredentialExchange(
+            connection_id="conn-id",
+            thread_id="thid",
+            initiator=test_module.V10CredentialExchange.INITIATOR_EXTERNAL,
+            role=test_module.V10CredentialExchange.ROLE_HOLDER,
+            state=test_module.V10CredentialExchange.STATE_CREDENTIAL_RECEIVED,
+            credential_definition_id=cred_def_id,
+            credential_request_metadata={
+                "master_secret_blinding_data": {"v_prime": "1234", "vr_prime": None},
+                "nonce": "5678",
+                "master_secret_name": "default",
+            },
+            raw_credential={
+                "schema_id": "LjgpST2rjsoxYegQDRm7EL:2:bc-reg:1.0",
+                "cred_def_id": cred_def_id,
+                "rev_reg_id": None,
+                "values": {"test": {"raw": "123", "encoded": "123"}},
+                "signature": {"p_credential": {"m_2": "42"}, "r_credential": None},
+                "signature_correctness_proof": {"se": "..."},
+                "rev_reg": None,
+                "witness": None,
+            },
+            auto_remove=True,
+        )
+        async with self.context.session() as session:
+            await cred_ex.save(session)
+            expected = (
+                await test_module.V10CredentialExchange.retrieve_by_id(
+                    session, cred_ex.credential_exchange_id
+                )
+            ).serialize()
+        assert expected["raw_credential"]["signature"]["r_credential"] is None
+
+        result = await test_module.credential_exchange_list(self.request)
+        assert orjson.loads(result.body) == {"results": [expected]}
+
     async def test_credential_exchange_retrieve(self):
         self.request.match_info = {"cred_ex_id": "dummy"}
 
@@ -81,7 +169,7 @@ class TestCredentialRoutes(AsyncTestCase):
             mock_cred_ex.serialize.return_value = {"hello": "world"}
 
             with async_mock.patch.object(
-                test_module.web, "json_response"
+                test_module, "_orjson_response"
             ) as mock_response:
                 await test_module.credential_exchange_retrieve(self.request)
                 mock_response.assert_called_once_with(
@@ -119,16 +207,24 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_retrieve(self.request)
 
     async def test_credential_exchange_create(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "credential_proposal": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    }
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_connection_record, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialPreview, "deserialize", autospec=True
+            test_module, "_load_preview", autospec=True
         ), async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
             mock_credential_manager.return_value.create_offer = (
                 async_mock.CoroutineMock()
@@ -154,16 +250,24 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
     async def test_credential_exchange_create_x(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "credential_proposal": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    }
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_connection_record, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialPreview, "deserialize", autospec=True
+            test_module, "_load_preview", autospec=True
         ), async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
             mock_credential_manager.return_value.create_offer = (
                 async_mock.CoroutineMock()
@@ -187,8 +291,8 @@ class TestCredentialRoutes(AsyncTestCase):
     async def test_credential_exchange_create_no_proposal(self):
         conn_id = "connection-id"
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps({"connection_id": conn_id})
         )
 
         with self.assertRaises(test_module.web.HTTPBadRequest) as context:
@@ -196,16 +300,25 @@ class TestCredentialRoutes(AsyncTestCase):
         assert "credential_proposal" in str(context.exception)
 
     async def test_credential_exchange_send(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "connection_id": "dummy",
+                    "credential_proposal": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialPreview, "deserialize", autospec=True
+            test_module, "_load_preview", autospec=True
         ), async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
             mock_credential_manager.return_value.create_offer = (
                 async_mock.CoroutineMock()
@@ -233,8 +346,8 @@ class TestCredentialRoutes(AsyncTestCase):
     async def test_credential_exchange_send_no_proposal(self):
         conn_id = "connection-id"
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps({"connection_id": conn_id})
         )
 
         with self.assertRaises(test_module.web.HTTPBadRequest) as context:
@@ -245,8 +358,10 @@ class TestCredentialRoutes(AsyncTestCase):
         conn_id = "connection-id"
         preview_spec = {"attributes": [{"name": "attr", "value": "value"}]}
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id, "credential_proposal": preview_spec}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"connection_id": conn_id, "credential_proposal": preview_spec}
+            )
         )
 
         with async_mock.patch.object(
@@ -272,8 +387,10 @@ class TestCredentialRoutes(AsyncTestCase):
         conn_id = "connection-id"
         preview_spec = {"attributes": [{"name": "attr", "value": "value"}]}
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id, "credential_proposal": preview_spec}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"connection_id": conn_id, "credential_proposal": preview_spec}
+            )
         )
 
         with async_mock.patch.object(
@@ -297,8 +414,10 @@ class TestCredentialRoutes(AsyncTestCase):
         conn_id = "connection-id"
         preview_spec = {"attributes": [{"name": "attr", "value": "value"}]}
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id, "credential_proposal": preview_spec}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"connection_id": conn_id, "credential_proposal": preview_spec}
+            )
         )
 
         with async_mock.patch.object(
@@ -306,15 +425,15 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialProposal, "deserialize", autospec=True
-        ) as mock_proposal_deserialize, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex_record = async_mock.MagicMock()
+            mock_cred_proposal = async_mock.MagicMock()
 
             mock_credential_manager.return_value.create_proposal.return_value = (
-                mock_cred_ex_record
+                mock_cred_ex_record,
+                mock_cred_proposal,
             )
 
             await test_module.credential_exchange_send_proposal(self.request)
@@ -324,18 +443,27 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
             self.request["outbound_message_router"].assert_awaited_once_with(
-                mock_proposal_deserialize.return_value, connection_id=conn_id
+                mock_cred_proposal, connection_id=conn_id
             )
 
     async def test_credential_exchange_send_proposal_no_conn_record(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "connection_id": "dummy",
+                    "credential_proposal": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialPreview, "deserialize", autospec=True
+            test_module, "_load_preview", autospec=True
         ) as mock_preview_deserialize:
 
             # Emulate storage not found (bad connection id)
@@ -354,8 +482,10 @@ class TestCredentialRoutes(AsyncTestCase):
         conn_id = "connection-id"
         preview_spec = {"attributes": [{"name": "attr", "value": "value"}]}
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"connection_id": conn_id, "credential_proposal": preview_spec}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"connection_id": conn_id, "credential_proposal": preview_spec}
+            )
         )
 
         with async_mock.patch.object(
@@ -363,25 +493,31 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialProposal, "deserialize", autospec=True
-        ) as mock_proposal_deserialize:
-            mock_cred_ex_record = async_mock.MagicMock()
-            mock_credential_manager.return_value.create_proposal.return_value = (
-                mock_cred_ex_record
-            )
-            mock_proposal_deserialize.side_effect = test_module.BaseModelError()
+            test_module, "_load_preview", autospec=True
+        ) as mock_preview_deserialize:
+            mock_preview_deserialize.side_effect = test_module.BaseModelError()
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.credential_exchange_send_proposal(self.request)
+            mock_credential_manager.return_value.create_proposal.assert_not_called()
 
     async def test_credential_exchange_send_proposal_not_ready(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "connection_id": "dummy",
+                    "credential_proposal": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.CredentialPreview, "deserialize", autospec=True
+            test_module, "_load_preview", autospec=True
         ) as mock_preview_deserialize:
 
             # Emulate connection not ready
@@ -396,15 +532,17 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_proposal(self.request)
 
     async def test_credential_exchange_create_free_offer(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "connection_id": "dummy",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "connection_id": "dummy",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.context.update_settings({"default_endpoint": "http://1.2.3.4:8081"})
@@ -436,7 +574,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "serialize_outofband"
         ) as mock_seroob, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
             mock_credential_manager.return_value.create_offer = (
                 async_mock.CoroutineMock()
@@ -456,38 +594,52 @@ class TestCredentialRoutes(AsyncTestCase):
                     "oob_url": "abc123",
                 }
             )
+            create_offer_args = (
+                mock_credential_manager.return_value.create_offer.call_args
+            )
+            counter_proposal = create_offer_args[1]["counter_proposal"]
+            assert counter_proposal.cred_def_id == "cred-def-id"
+            assert counter_proposal.credential_proposal.attr_dict() == {
+                "hello": "world"
+            }
+            assert create_offer_args[0][0].credential_proposal_dict is None
 
     async def test_credential_exchange_create_free_offer_no_cred_def_id(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "connection_id": "dummy",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "connection_id": "dummy",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.credential_exchange_create_free_offer(self.request)
 
     async def test_credential_exchange_create_free_offer_no_preview(self):
-        self.request.json = async_mock.CoroutineMock()
-        self.request.json.return_value = {"comment": "comment", "cred_def_id": "dummy"}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps({"comment": "comment", "cred_def_id": "dummy"})
+        )
 
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.credential_exchange_create_free_offer(self.request)
 
     async def test_credential_exchange_create_free_offer_retrieve_conn_rec_x(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "connection_id": "dummy",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "connection_id": "dummy",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.session_inject[BaseWallet] = async_mock.MagicMock(
@@ -503,14 +655,16 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_create_free_offer(self.request)
 
     async def test_credential_exchange_create_free_offer_no_conn_id(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.context.update_settings({"default_endpoint": "http://1.2.3.4:8081"})
@@ -542,7 +696,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "serialize_outofband"
         ) as mock_seroob, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_credential_manager.return_value.create_offer = (
@@ -568,14 +722,16 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
     async def test_credential_exchange_create_free_offer_no_conn_id_no_public_did(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.context.update_settings({"default_endpoint": "http://1.2.3.4:8081"})
@@ -587,14 +743,16 @@ class TestCredentialRoutes(AsyncTestCase):
             await test_module.credential_exchange_create_free_offer(self.request)
 
     async def test_credential_exchange_create_free_offer_no_endpoint(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.session_inject[BaseWallet] = async_mock.MagicMock(
@@ -611,17 +769,20 @@ class TestCredentialRoutes(AsyncTestCase):
 
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.credential_exchange_create_free_offer(self.request)
+        self.session_inject[BaseWallet].get_public_did.assert_awaited_once()
 
     async def test_credential_exchange_create_free_offer_deser_x(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "connection_id": "dummy",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "connection_id": "dummy",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         self.context.update_settings({"default_endpoint": "http://1.2.3.4:8081"})
@@ -663,14 +824,16 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_create_free_offer(self.request)
 
     async def test_credential_exchange_send_free_offer(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "credential_preview": {
-                    "attributes": [{"name": "hello", "value": "world"}]
-                },
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
         )
 
         with async_mock.patch.object(
@@ -678,7 +841,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "CredentialManager", autospec=True
         ) as mock_credential_manager, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_credential_manager.return_value.create_offer = (
@@ -698,30 +861,70 @@ class TestCredentialRoutes(AsyncTestCase):
                 mock_cred_ex_record.serialize.return_value
             )
 
+    async def test_credential_exchange_send_free_offer_serialize_x(self):
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
+        )
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module, "CredentialManager", autospec=True
+        ) as mock_credential_manager:
+
+            mock_cred_ex_record = async_mock.MagicMock(
+                serialize=async_mock.MagicMock(side_effect=test_module.BaseModelError())
+            )
+            mock_offer = async_mock.MagicMock()
+            mock_credential_manager.return_value.create_offer = (
+                async_mock.CoroutineMock(return_value=(mock_cred_ex_record, mock_offer))
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_send_free_offer(self.request)
+            assert all(  # offer not sent; problem report only
+                call[0][0] is not mock_offer
+                for call in self.request["outbound_message_router"].call_args_list
+            )
+
     async def test_credential_exchange_send_free_offer_no_cred_def_id(self):
-        self.request.json = async_mock.CoroutineMock()
-        self.request.json.return_value = {
-            "comment": "comment",
-            "credential_preview": "dummy",
-        }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "comment": "comment",
+                    "credential_preview": "dummy",
+                }
+            )
+        )
 
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.credential_exchange_send_free_offer(self.request)
 
     async def test_credential_exchange_send_free_offer_no_preview(self):
-        self.request.json = async_mock.CoroutineMock()
-        self.request.json.return_value = {"comment": "comment", "cred_def_id": "dummy"}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps({"comment": "comment", "cred_def_id": "dummy"})
+        )
 
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.credential_exchange_send_free_offer(self.request)
 
     async def test_credential_exchange_send_free_offer_no_conn_record(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "auto_issue": False,
-                "cred_def_id": "cred-def-id",
-                "credential_preview": "dummy",
-            }
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": False,
+                    "cred_def_id": "cred-def-id",
+                    "credential_preview": "dummy",
+                }
+            )
         )
 
         with async_mock.patch.object(
@@ -747,8 +950,18 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_free_offer(self.request)
 
     async def test_credential_exchange_send_free_offer_not_ready(self):
-        self.request.json = async_mock.CoroutineMock()
-        self.request.json.return_value["auto_issue"] = True
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {
+                    "auto_issue": True,
+                    "cred_def_id": "cred-def-id",
+                    "connection_id": "dummy",
+                    "credential_preview": {
+                        "attributes": [{"name": "hello", "value": "world"}]
+                    },
+                }
+            )
+        )
 
         with async_mock.patch.object(
             test_module, "ConnRecord", autospec=True
@@ -772,7 +985,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_free_offer(self.request)
 
     async def test_credential_exchange_send_bound_offer(self):
-        self.request.json = async_mock.CoroutineMock(return_value={})
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -782,7 +995,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
@@ -807,8 +1020,84 @@ class TestCredentialRoutes(AsyncTestCase):
                 mock_cred_ex_record.serialize.return_value
             )
 
+    async def test_credential_exchange_send_bound_offer_serialize_x(self):
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module, "CredentialManager", autospec=True
+        ) as mock_credential_manager, async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex:
+
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
+            mock_cred_ex.retrieve_by_id.return_value.state = (
+                mock_cred_ex.STATE_PROPOSAL_RECEIVED
+            )
+
+            mock_cred_ex_record = async_mock.MagicMock(
+                serialize=async_mock.MagicMock(
+                    side_effect=test_module.BaseModelError()
+                ),
+                save_error_state=async_mock.CoroutineMock(),
+            )
+            mock_offer = async_mock.MagicMock()
+            mock_credential_manager.return_value.create_offer = (
+                async_mock.CoroutineMock(return_value=(mock_cred_ex_record, mock_offer))
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_send_bound_offer(self.request)
+            mock_cred_ex_record.save_error_state.assert_awaited_once()
+            assert all(  # offer not sent; problem report only
+                call[0][0] is not mock_offer
+                for call in self.request["outbound_message_router"].call_args_list
+            )
+
+    async def test_credential_exchange_send_bound_offer_no_body(self):
+        self.request.body_exists = False
+        self.request.read = async_mock.CoroutineMock()
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module, "CredentialManager", autospec=True
+        ) as mock_credential_manager, async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "_orjson_response"
+        ) as mock_response:
+
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
+            mock_cred_ex.retrieve_by_id.return_value.state = (
+                mock_cred_ex.STATE_PROPOSAL_RECEIVED
+            )
+
+            mock_cred_ex_record = async_mock.MagicMock()
+            mock_credential_manager.return_value.create_offer = (
+                async_mock.CoroutineMock(
+                    return_value=(mock_cred_ex_record, async_mock.MagicMock())
+                )
+            )
+
+            await test_module.credential_exchange_send_bound_offer(self.request)
+
+            self.request.read.assert_not_awaited()
+            assert (
+                mock_credential_manager.return_value.create_offer.call_args[1][
+                    "counter_proposal"
+                ]
+                is None
+            )
+            mock_response.assert_called_once_with(
+                mock_cred_ex_record.serialize.return_value
+            )
+
     async def test_credential_exchange_send_bound_offer_bad_cred_ex_id(self):
-        self.request.json = async_mock.CoroutineMock(return_value={})
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -822,8 +1111,26 @@ class TestCredentialRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPNotFound):
                 await test_module.credential_exchange_send_bound_offer(self.request)
 
+    async def test_credential_exchange_send_bound_offer_deser_x(self):
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps({"counter_proposal": {"bad": "proposal"}})
+        )
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module.CredentialProposal, "deserialize", autospec=True
+        ) as mock_proposal_deserialize:
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
+            mock_proposal_deserialize.side_effect = test_module.BaseModelError()
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_send_bound_offer(self.request)
+            mock_cred_ex.retrieve_by_id.assert_not_awaited()
+
     async def test_credential_exchange_send_bound_offer_no_conn_record(self):
-        self.request.json = async_mock.CoroutineMock(return_value={})
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -859,7 +1166,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_bound_offer(self.request)
 
     async def test_credential_exchange_send_bound_offer_bad_state(self):
-        self.request.json = async_mock.CoroutineMock(return_value={})
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -878,7 +1185,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_bound_offer(self.request)
 
     async def test_credential_exchange_send_bound_offer_not_ready(self):
-        self.request.json = async_mock.CoroutineMock(return_value={})
+        self.request.read = async_mock.CoroutineMock(return_value=orjson.dumps({}))
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -910,6 +1217,23 @@ class TestCredentialRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPForbidden):
                 await test_module.credential_exchange_send_bound_offer(self.request)
 
+    async def test_credential_exchange_send_bound_offer_retrieve_x(self):
+        self.request.body_exists = False
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            self.context, "session", wraps=self.context.session
+        ) as mock_session:
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError()
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_send_bound_offer(self.request)
+            mock_session.assert_called_once()
+
     async def test_credential_exchange_send_request(self):
         self.request.json = async_mock.CoroutineMock()
         self.request.match_info = {"cred_ex_id": "dummy"}
@@ -921,7 +1245,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
@@ -957,6 +1281,22 @@ class TestCredentialRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPNotFound):
                 await test_module.credential_exchange_send_request(self.request)
 
+    async def test_credential_exchange_send_request_retrieve_x(self):
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            self.context, "session", wraps=self.context.session
+        ) as mock_session:
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError()
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_send_request(self.request)
+            mock_session.assert_called_once()
+
     async def test_credential_exchange_send_request_no_conn_record(self):
         self.request.json = async_mock.CoroutineMock()
         self.request.match_info = {"cred_ex_id": "dummy"}
@@ -1026,7 +1366,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_send_request(self.request)
 
     async def test_credential_exchange_issue(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1036,7 +1376,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
@@ -1058,7 +1398,7 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
     async def test_credential_exchange_issue_bad_cred_ex_id(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1073,7 +1413,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_issue(self.request)
 
     async def test_credential_exchange_issue_no_conn_record(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         mock_cred_ex_rec = async_mock.MagicMock(
@@ -1095,7 +1435,7 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
             # Emulate storage not found (bad connection id)
-            mock_conn_rec.retrieve_by_id = async_mock.CoroutineMock(
+            mock_conn_rec.retrieve_is_ready = async_mock.CoroutineMock(
                 side_effect=test_module.StorageNotFoundError()
             )
 
@@ -1111,7 +1451,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_issue(self.request)
 
     async def test_credential_exchange_issue_not_ready(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1128,8 +1468,9 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
             # Emulate connection not ready
-            mock_conn_rec.retrieve_by_id = async_mock.CoroutineMock()
-            mock_conn_rec.retrieve_by_id.return_value.is_ready = False
+            mock_conn_rec.retrieve_is_ready = async_mock.CoroutineMock(
+                return_value=False
+            )
 
             mock_credential_manager.return_value.issue_credential = (
                 async_mock.CoroutineMock()
@@ -1143,7 +1484,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_issue(self.request)
 
     async def test_credential_exchange_issue_rev_reg_full(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         mock_cred_ex_rec = async_mock.MagicMock(
@@ -1175,7 +1516,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_issue(self.request)
 
     async def test_credential_exchange_issue_deser_x(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         mock_cred_ex_rec = async_mock.MagicMock(
@@ -1205,7 +1546,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_issue(self.request)
 
     async def test_credential_exchange_store(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1215,7 +1556,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
@@ -1239,10 +1580,48 @@ class TestCredentialRoutes(AsyncTestCase):
                 mock_cred_ex_record.serialize.return_value
             )
 
+    async def test_credential_exchange_store_no_body(self):
+        self.request.body_exists = False
+        self.request.read = async_mock.CoroutineMock()
+        self.request.match_info = {"cred_ex_id": "dummy"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module, "CredentialManager", autospec=True
+        ) as mock_credential_manager, async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module, "_orjson_response"
+        ) as mock_response:
+
+            mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
+            mock_cred_ex.retrieve_by_id.return_value.state = (
+                mock_cred_ex.STATE_CREDENTIAL_RECEIVED
+            )
+
+            mock_cred_ex_record = async_mock.MagicMock()
+
+            mock_credential_manager.return_value.store_credential.return_value = (
+                mock_cred_ex_record
+            )
+            mock_credential_manager.return_value.send_credential_ack.return_value = (
+                mock_cred_ex_record,
+                async_mock.MagicMock(),
+            )
+
+            await test_module.credential_exchange_store(self.request)
+
+            self.request.read.assert_not_awaited()
+            mock_credential_manager.return_value.store_credential.assert_called_once_with(
+                mock_cred_ex.retrieve_by_id.return_value, None
+            )
+            mock_response.assert_called_once_with(
+                mock_cred_ex_record.serialize.return_value
+            )
+
     async def test_credential_exchange_store_bad_cred_id_json(self):
-        self.request.json = async_mock.CoroutineMock(
-            side_effect=test_module.JSONDecodeError("Nope", "Nope", 0)
-        )
+        self.request.read = async_mock.CoroutineMock(return_value=b"{not json")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1252,7 +1631,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_credential_manager, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
+            test_module, "_orjson_response"
         ) as mock_response:
 
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
@@ -1277,7 +1656,7 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
     async def test_credential_exchange_store_bad_cred_ex_id(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1292,7 +1671,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_store(self.request)
 
     async def test_credential_exchange_store_no_conn_record(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1310,7 +1689,7 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
             # Emulate storage not found (bad connection id)
-            mock_conn_rec.retrieve_by_id = async_mock.CoroutineMock(
+            mock_conn_rec.retrieve_is_ready = async_mock.CoroutineMock(
                 side_effect=test_module.StorageNotFoundError()
             )
 
@@ -1326,7 +1705,7 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_store(self.request)
 
     async def test_credential_exchange_store_not_ready(self):
-        self.request.json = async_mock.CoroutineMock()
+        self.request.read = async_mock.CoroutineMock(return_value=b"{}")
         self.request.match_info = {"cred_ex_id": "dummy"}
 
         with async_mock.patch.object(
@@ -1344,8 +1723,9 @@ class TestCredentialRoutes(AsyncTestCase):
             )
 
             # Emulate connection not ready
-            mock_conn_rec.retrieve_by_id = async_mock.CoroutineMock()
-            mock_conn_rec.retrieve_by_id.return_value.is_ready = False
+            mock_conn_rec.retrieve_is_ready = async_mock.CoroutineMock(
+                return_value=False
+            )
 
             with self.assertRaises(test_module.web.HTTPForbidden):
                 await test_module.credential_exchange_store(self.request)
@@ -1355,17 +1735,17 @@ class TestCredentialRoutes(AsyncTestCase):
 
         with async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
-        ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
-        ) as mock_response:
+        ) as mock_cred_ex:
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
             mock_cred_ex.retrieve_by_id.return_value = mock_cred_ex
 
             mock_cred_ex.delete_record = async_mock.CoroutineMock()
 
-            await test_module.credential_exchange_remove(self.request)
+            result = await test_module.credential_exchange_remove(self.request)
 
-            mock_response.assert_called_once_with({})
+            assert result.status == 200
+            assert result.content_type == "application/json"
+            assert result.body == b"{}"
 
     async def test_credential_exchange_remove_bad_cred_ex_id(self):
         mock = async_mock.MagicMock()
@@ -1403,8 +1783,10 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_remove(self.request)
 
     async def test_credential_exchange_problem_report(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"description": "Did I say no problem? I meant 'no: problem.'"}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"description": "Did I say no problem? I meant 'no: problem.'"}
+            )
         )
         self.request.match_info = {"cred_ex_id": "dummy"}
         magic_report = async_mock.MagicMock()
@@ -1415,9 +1797,7 @@ class TestCredentialRoutes(AsyncTestCase):
             test_module, "ConnRecord", autospec=True
         ) as mock_conn_rec, async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
-        ) as mock_cred_ex, async_mock.patch.object(
-            test_module.web, "json_response"
-        ) as mock_response:
+        ) as mock_cred_ex:
             mock_cred_mgr_cls.return_value = async_mock.MagicMock(
                 create_problem_report=async_mock.CoroutineMock(
                     return_value=magic_report
@@ -1425,17 +1805,21 @@ class TestCredentialRoutes(AsyncTestCase):
             )
             mock_cred_ex.retrieve_by_id = async_mock.CoroutineMock()
 
-            await test_module.credential_exchange_problem_report(self.request)
+            result = await test_module.credential_exchange_problem_report(self.request)
 
             self.request["outbound_message_router"].assert_awaited_once_with(
                 magic_report,
                 connection_id=mock_cred_ex.retrieve_by_id.return_value.connection_id,
             )
-            mock_response.assert_called_once_with({})
+            assert result.status == 200
+            assert result.content_type == "application/json"
+            assert result.body == b"{}"
 
     async def test_credential_exchange_problem_report_bad_cred_ex_id(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"description": "Did I say no problem? I meant 'no: problem.'"}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"description": "Did I say no problem? I meant 'no: problem.'"}
+            )
         )
         self.request.match_info = {"cred_ex_id": "dummy"}
 
@@ -1450,8 +1834,10 @@ class TestCredentialRoutes(AsyncTestCase):
                 await test_module.credential_exchange_problem_report(self.request)
 
     async def test_credential_exchange_problem_report_x(self):
-        self.request.json = async_mock.CoroutineMock(
-            return_value={"description": "Did I say no problem? I meant 'no: problem.'"}
+        self.request.read = async_mock.CoroutineMock(
+            return_value=orjson.dumps(
+                {"description": "Did I say no problem? I meant 'no: problem.'"}
+            )
         )
         self.request.match_info = {"cred_ex_id": "dummy"}
 
@@ -1470,6 +1856,106 @@ class TestCredentialRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.credential_exchange_problem_report(self.request)
 
+    async def test_orjson_response(self):
+        response = test_module._orjson_response({"hello": "wörld", 1: [True, None]})
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        assert response.body == '{"hello":"wörld","1":[true,null]}'.encode()
+
+        response = test_module._orjson_response({}, status=201)
+        assert response.status == 201
+        assert response.body == b"{}"
+
+    async def test_read_json(self):
+        self.request.read = async_mock.CoroutineMock(return_value=b'{"a": [1, null]}')
+        assert await test_module._read_json(self.request) == {"a": [1, None]}
+
+        self.request.read = async_mock.CoroutineMock(return_value=b"")
+        assert await test_module._read_json(self.request) == {}
+
+        self.request.read = async_mock.CoroutineMock(return_value=b"{not json")
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module._read_json(self.request)
+
+    async def test_cred_def_tag_kwargs(self):
+        assert (
+            test_module._cred_def_tag_kwargs(
+                {
+                    "cred_def_id": "cred-def-id",
+                    "schema_id": "",
+                    "issuer_did": None,
+                    "comment": "not a tag",
+                }
+            )
+            == {"cred_def_id": "cred-def-id"}
+        )
+        assert test_module._cred_def_tag_kwargs({}) == {}
+
+    async def test_load_preview(self):
+        preview = test_module._load_preview(
+            {
+                "attributes": [
+                    {"name": "hello", "value": "world"},
+                    {"value": "42", "name": "answer"},
+                ]
+            }
+        )
+        assert preview.attr_dict() == {"hello": "world", "answer": "42"}
+        hits = test_module._validated_preview_attrs.cache_info().hits
+        again = test_module._load_preview(
+            {
+                "attributes": [
+                    {"value": "world", "name": "hello"},
+                    {"name": "answer", "value": "42"},
+                ]
+            }
+        )
+        assert test_module._validated_preview_attrs.cache_info().hits == hits + 1
+        assert again.serialize() == preview.serialize()
+        assert again is not preview
+        assert again.attributes[0] is not preview.attributes[0]
+
+        preview.attributes[0].value = "mutated"
+        assert test_module._load_preview(
+            {"attributes": [{"name": "hello", "value": "world"}]}
+        ).attr_dict() == {"hello": "world"}
+
+        large = {
+            "attributes": [
+                {
+                    "name": "icon",
+                    "mime-type": "image/png",
+                    "value": "A" * test_module._PREVIEW_CACHE_MAX_SPEC_BYTES,
+                }
+            ]
+        }
+        currsize = test_module._validated_preview_attrs.cache_info().currsize
+        assert test_module._load_preview(large).mime_types() == {"icon": "image/png"}
+        assert test_module._validated_preview_attrs.cache_info().currsize == currsize
+
+        with self.assertRaises(test_module.BaseModelError):
+            test_module._load_preview({"attributes": [{"value": "no name"}]})
+        with self.assertRaises(test_module.BaseModelError):
+            test_module._load_preview(
+                {"attributes": [{"value": "A" * 5000, "mime-type": "image/png"}]}
+            )
+
+    async def test_list_query_string_schema(self):
+        schema = test_module.V10CredentialExchangeListQueryStringSchema()
+        assert schema.load({"role": "issuer", "state": "offer_sent"}) == {
+            "role": "issuer",
+            "state": "offer_sent",
+        }
+        assert "role" in schema.validate({"role": "no-such-role"})
+        assert "state" in schema.validate({"state": "no-such-state"})
+
+        validator = test_module.OneOfSet(["a", "b"])
+        assert validator("a") == "a"
+        with self.assertRaises(test_module.ValidationError):
+            validator("c")
+        with self.assertRaises(test_module.ValidationError):
+            validator(["a"])
+
     async def test_register(self):
         mock_app = async_mock.MagicMock()
         mock_app.add_routes = async_mock.MagicMock()
@@ -1480,4 +1966,7 @@ class TestCredentialRoutes(AsyncTestCase):
     async def test_post_process_routes(self):
         mock_app = async_mock.MagicMock(_state={"swagger_dict": {}})
         test_module.post_process_routes(mock_app)
-        assert "tags" in mock_app._state["swagger_dict"]
+        assert mock_app._state["swagger_dict"]["tags"] == [test_module._SWAGGER_TAG]
+
+        test_module.post_process_routes(mock_app)
+        assert len(mock_app._state["swagger_dict"]["tags"]) == 2
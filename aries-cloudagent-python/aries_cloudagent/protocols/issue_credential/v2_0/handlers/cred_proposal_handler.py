@@ -1,5 +1,7 @@
 """Credential proposal message handler."""
 
+import logging
+
 from .....indy.issuer import IndyIssuerError
 from .....ledger.error import LedgerError
 from .....messaging.base_handler import BaseHandler, HandlerException
@@ -28,10 +30,11 @@ class V20CredProposalHandler(BaseHandler):
 
         self._logger.debug("V20CredProposalHandler called with context %s", context)
         assert isinstance(context.message, V20CredProposal)
-        self._logger.info(
-            "Received v2.0 credential proposal message: %s",
-            context.message.serialize(as_string=True),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Received v2.0 credential proposal message: %s",
+                context.message.serialize(as_string=True),
+            )
 
         if not context.connection_ready:
             raise HandlerException("No connection established for credential proposal")
@@ -61,10 +64,11 @@ class V20CredProposalHandler(BaseHandler):
             except (V20CredManagerError, IndyIssuerError, LedgerError) as err:
                 self._logger.exception(err)
                 if cred_ex_record:
-                    await cred_ex_record.save_error_state(
-                        context.session(),
-                        reason=err.message,
-                    )
+                    async with context.session() as session:
+                        await cred_ex_record.save_error_state(
+                            session,
+                            reason=err.message,
+                        )
             except StorageError as err:
                 self._logger.exception(err)  # may be logging to wire, not dead disk
 
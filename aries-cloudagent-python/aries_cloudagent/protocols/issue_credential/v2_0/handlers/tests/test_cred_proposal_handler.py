@@ -34,6 +34,36 @@ class TestV20CredProposalHandler(AsyncTestCase):
         )
         assert not responder.messages
 
+    async def test_called_no_info_log(self):
+        request_context = RequestContext.test_context()
+        request_context.message_receipt = MessageReceipt()
+        request_context.connection_record = async_mock.MagicMock()
+
+        with async_mock.patch.object(
+            test_module, "V20CredManager", autospec=True
+        ) as mock_cred_mgr:
+            mock_cred_mgr.return_value.receive_proposal = async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock()
+            )
+            mock_cred_mgr.return_value.receive_proposal.return_value.auto_offer = False
+            request_context.message = V20CredProposal()
+            request_context.connection_ready = True
+            handler_inst = test_module.V20CredProposalHandler()
+            handler_inst._logger = async_mock.MagicMock(
+                isEnabledFor=async_mock.MagicMock(return_value=False)
+            )
+            responder = MockResponder()
+            with async_mock.patch.object(
+                request_context.message, "serialize", autospec=True
+            ) as mock_serialize:
+                await handler_inst.handle(request_context, responder)
+            mock_serialize.assert_not_called()
+            handler_inst._logger.info.assert_not_called()
+
+        mock_cred_mgr.return_value.receive_proposal.assert_called_once_with(
+            request_context.message, request_context.connection_record.connection_id
+        )
+
     async def test_called_auto_offer(self):
         request_context = RequestContext.test_context()
         request_context.message_receipt = MessageReceipt()
@@ -70,12 +100,17 @@ class TestV20CredProposalHandler(AsyncTestCase):
         request_context.message_receipt = MessageReceipt()
         request_context.connection_record = async_mock.MagicMock()
 
+        async def _save_error_state(session, **kwargs):
+            assert session.active
+
         with async_mock.patch.object(
             test_module, "V20CredManager", autospec=True
         ) as mock_cred_mgr:
             mock_cred_mgr.return_value.receive_proposal = async_mock.CoroutineMock(
                 return_value=async_mock.MagicMock(
-                    save_error_state=async_mock.CoroutineMock()
+                    save_error_state=async_mock.CoroutineMock(
+                        side_effect=_save_error_state
+                    )
                 )
             )
             mock_cred_mgr.return_value.receive_proposal.return_value.auto_offer = True
@@ -98,6 +133,8 @@ class TestV20CredProposalHandler(AsyncTestCase):
                 await handler.handle(request_context, responder)  # storage error
                 mock_send_reply.assert_not_called()
 
+            mock_cred_mgr.return_value.receive_proposal.return_value.save_error_state.assert_awaited_once()
+
     async def test_called_not_ready(self):
         request_context = RequestContext.test_context()
         request_context.message_receipt = MessageReceipt()